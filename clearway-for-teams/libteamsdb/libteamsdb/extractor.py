@@ -233,7 +233,11 @@ class TeamsDatabaseExtractor:
         if self._db is None:
             return {}
 
-        conversations: Dict[str, Tuple[float, Dict[str, object]]] = {}
+        # Precedence key per record: newer version wins; at equal version an
+        # unread record replaces a read one. Computing (version, not_read)
+        # once per record turns the collision branch into a single tuple
+        # compare instead of re-deriving version and isRead on every clash.
+        conversations: Dict[str, Tuple[float, bool, Dict[str, object]]] = {}
 
         for record in self._db.iterate_records(db_id, self.CONVERSATION_STORE_ID):
             value = record.value
@@ -244,32 +248,19 @@ class TeamsDatabaseExtractor:
             if not conv_id:
                 continue
 
-            # Get version for deduplication
             version = get_float_value(value, "version")
             if version == 0.0:
                 version = get_float_value(value, "detailsVersion")
 
+            thread_props = get_nested_dict(value, "threadProperties")
+            not_read = not get_bool_value(thread_props, "isRead", True)
+
             existing = conversations.get(conv_id)
-            if existing is None:
-                conversations[conv_id] = (version, value)
-            else:
-                existing_version, existing_data = existing
-                # Keep newer version, or if same version, prefer unread state
-                if version > existing_version:
-                    conversations[conv_id] = (version, value)
-                elif version == existing_version:
-                    # Prefer the one that indicates unread
-                    existing_props = get_nested_dict(existing_data, "threadProperties")
-                    new_props = get_nested_dict(value, "threadProperties")
-
-                    existing_read = get_bool_value(existing_props, "isRead", True)
-                    new_read = get_bool_value(new_props, "isRead", True)
-
-                    if existing_read and not new_read:
-                        conversations[conv_id] = (version, value)
-
-        # Return just the data, not the version tuple
-        return {k: v[1] for k, v in conversations.items()}
+            if existing is None or (version, not_read) > existing[:2]:
+                conversations[conv_id] = (version, not_read, value)
+
+        # Return just the data, not the precedence key
+        return {k: v[2] for k, v in conversations.items()}
 
     def _load_messages(self, db_id: int) -> Dict[str, List[Message]]:
         """Load messages from reply chains.
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, List, Optional, Dict, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -57,6 +58,16 @@ class Message(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    @cached_property
+    def display_header(self) -> str:
+        """Pre-rendered Rich header line (unread dot, timestamp, sender).
+
+        Computed once per message so viewers re-mounting widgets during
+        scrolling don't pay a strftime plus string build every time.
+        """
+        prefix = "[red]●[/] " if self.is_unread else "  "
+        return f"{prefix}[dim]{self.timestamp:%Y-%m-%d %H:%M}[/] [bold]{self.sender_name}[/]"
+
 
 class Conversation(BaseModel):
     """Represents a Teams conversation (chat or channel).
@@ -135,6 +146,11 @@ class Conversation(BaseModel):
         """Check if conversation has unread messages."""
         return self.unread_count > 0
 
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, cached for case-insensitive filtering."""
+        return self.title.lower()
+
     model_config = ConfigDict(frozen=True)
 
 
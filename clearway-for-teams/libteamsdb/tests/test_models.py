@@ -86,6 +86,22 @@ class TestMessage:
 
         assert msg.is_unread
 
+    def test_display_header(self) -> None:
+        """Test the pre-rendered header line."""
+        msg = Message(
+            id="msg-004",
+            sender_id="8:orgid:sender-004",
+            sender_name="Header Sender",
+            content="Hi",
+            timestamp=datetime(2024, 1, 15, 10, 30),
+            conversation_id="conv-001",
+            is_unread=True,
+        )
+
+        assert msg.display_header == (
+            "[red]●[/] [dim]2024-01-15 10:30[/] [bold]Header Sender[/]"
+        )
+
     def test_message_default_unread_false(self) -> None:
         """Test that messages default to not unread."""
         msg = Message(
@@ -192,6 +208,19 @@ class TestConversation:
 
         assert conv.thread_type == ThreadType.TOPIC
 
+    def test_title_lower_cached(self) -> None:
+        """Test the precomputed lowercase title used for filtering."""
+        conv = Conversation(
+            id="conv-filter-001",
+            title="Weekly Sync",
+            last_message_time=datetime.now(),
+            messages=[],
+        )
+
+        assert conv.title_lower == "weekly sync"
+        # cached_property returns the same string object on repeat access
+        assert conv.title_lower is conv.title_lower
+
     def test_unread_count_validation(self) -> None:
         """Test that unread count must be non-negative."""
         with pytest.raises(Exception):  # pydantic will validate
@@ -13,12 +13,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import (
     Footer,
     Header,
@@ -41,6 +43,58 @@ from libteamsdb import (
 )
 
 
+class MessageStore:
+    """Backing store for the virtualized message view.
+
+    Holds a conversation's full message list as plain models and tracks
+    which suffix of it is currently mounted as widgets, so the widget
+    tree stays O(window) no matter how long the history is.
+    """
+
+    WINDOW_SIZE = 50
+    HYDRATE_BUFFER = 15
+
+    def __init__(self) -> None:
+        self._messages: List[Message] = []
+        self._first_mounted = 0
+
+    def load(self, messages: List[Message]) -> List[Message]:
+        """Take over a conversation's messages; return the initial window."""
+        self._messages = messages
+        self._first_mounted = max(0, len(messages) - self.WINDOW_SIZE)
+        return messages[self._first_mounted :]
+
+    @property
+    def hidden_above(self) -> int:
+        """How many older messages are held but not mounted."""
+        return self._first_mounted
+
+    def hydrate_above(self) -> List[Message]:
+        """Release the next batch of older messages, oldest first."""
+        if self._first_mounted == 0:
+            return []
+        start = max(0, self._first_mounted - self.HYDRATE_BUFFER)
+        batch = self._messages[start : self._first_mounted]
+        self._first_mounted = start
+        return batch
+
+
+class MessageScroll(VerticalScroll):
+    """Message container that requests older messages near the top.
+
+    The app assigns on_near_top; it fires whenever the view is scrolled
+    within two viewports of the top, which is the cue to hydrate more
+    history above the current window.
+    """
+
+    on_near_top: Optional[Callable[[], None]] = None
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self.on_near_top is not None and new_value <= self.size.height * 2:
+            self.on_near_top()
+
+
 class ConversationItem(ListItem):
     """A widget to display a conversation in the list."""
 
@@ -48,7 +102,7 @@ class ConversationItem(ListItem):
         super().__init__()
         self.conversation = conversation
 
-    def compose(self) -> ComposeResult:
+    def _display_text(self) -> str:
         conv = self.conversation
 
         # Type indicator
@@ -77,7 +131,15 @@ class ConversationItem(ListItem):
         if len(display) > 40:
             display = display[:37] + "..."
 
-        yield Label(display)
+        return display
+
+    def compose(self) -> ComposeResult:
+        yield Label(self._display_text())
+
+    def update_conversation(self, conversation: Conversation) -> None:
+        """Rebind to refreshed data and redraw the label in place."""
+        self.conversation = conversation
+        self.query_one(Label).update(self._display_text())
 
 
 class MessageItem(Static):
@@ -90,18 +152,10 @@ class MessageItem(Static):
     def compose(self) -> ComposeResult:
         msg = self.message
 
-        # Format timestamp
-        ts_str = msg.timestamp.strftime("%Y-%m-%d %H:%M")
-
-        # Unread indicator
-        if msg.is_unread:
-            prefix = "[red]●[/] "
-        else:
-            prefix = "  "
-
-        # Header line with timestamp and sender
-        header = f"{prefix}[dim]{ts_str}[/] [bold]{msg.sender_name}[/]"
-        yield Label(header)
+        # Header is pre-rendered on the model, so mounting (and the
+        # re-mounts the virtualized view does while scrolling) attaches
+        # an existing string instead of formatting a new one.
+        yield Label(msg.display_header)
 
         # Message content with wrapping
         content = msg.content if msg.content else "[dim](no content)[/]"
@@ -228,9 +282,32 @@ class TeamsViewer(App[None]):
     show_unread_only: reactive[bool] = reactive(False)
     db_location: Optional[DatabaseLocation] = None
 
+    # Debounce delay for search keystrokes, in seconds
+    SEARCH_DEBOUNCE = 0.08
+
+    # Rough rendered height of one MessageItem in terminal rows, used to
+    # keep the scroll position steady when history is mounted above it
+    ESTIMATED_MESSAGE_HEIGHT = 5
+
     def __init__(self, db_path: Optional[Path] = None) -> None:
         super().__init__()
         self._specified_db_path = db_path
+        self._search_timer: Optional[Timer] = None
+        self._pending_filter = ""
+        # What the ListView currently shows, so identical filter results
+        # (common while typing) don't rebuild N widgets for nothing.
+        self._rendered_keys: List[Tuple[str, int, str]] = []
+        self._message_store = MessageStore()
+        self._hydrating = False
+        # (db max-mtime, conversations) from the last extraction; repeat
+        # refreshes reuse it while the database is unchanged on disk.
+        self._conv_cache: Optional[Tuple[float, List[Conversation]]] = None
+        # The conversation currently shown in the message pane, so
+        # re-highlighting it (index assignment fires Highlighted on top of
+        # the explicit call, and arrowing revisits items) doesn't re-mount
+        # the whole pane. Tracked by object identity: a refresh builds new
+        # model objects, so changed data still re-renders.
+        self._current_conv: Optional[Conversation] = None
 
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
@@ -248,7 +325,7 @@ class TeamsViewer(App[None]):
             # Message view area
             with Vertical(id="message-view"):
                 yield Label("Select a conversation", id="conv-header")
-                with VerticalScroll(id="messages"):
+                with MessageScroll(id="messages"):
                     yield Label(
                         "Loading conversations...",
                         id="empty-state",
@@ -259,6 +336,7 @@ class TeamsViewer(App[None]):
 
     def on_mount(self) -> None:
         """Initialize data when app mounts."""
+        self.query_one("#messages", MessageScroll).on_near_top = self._hydrate_above
         self.action_refresh()
 
     def watch_current_filter(self, filter_text: str) -> None:
@@ -277,7 +355,7 @@ class TeamsViewer(App[None]):
         if self.current_filter:
             filter_lower = self.current_filter.lower()
             conversations = [
-                c for c in conversations if filter_lower in c.title.lower()
+                c for c in conversations if filter_lower in c.title_lower
             ]
 
         # Apply unread filter
@@ -290,10 +368,59 @@ class TeamsViewer(App[None]):
     def _update_conversation_list(self) -> None:
         """Update the conversation list view."""
         conv_list = self.query_one("#conv-list", ListView)
-        conv_list.clear()
 
-        for conv in self.filtered_conversations:
-            conv_list.append(ConversationItem(conv))
+        # Rebuilding mounts one widget per conversation, which dominates
+        # search latency; skip it entirely when the visible list and the
+        # fields it renders are unchanged.
+        new_keys = [
+            (c.id, c.unread_count, c.title) for c in self.filtered_conversations
+        ]
+        if new_keys != self._rendered_keys:
+            old_ids = [key[0] for key in self._rendered_keys]
+            new_ids = [key[0] for key in new_keys]
+
+            if new_ids == old_ids:
+                # Same conversations in the same order (the common refresh
+                # case): redraw only the labels whose data changed instead
+                # of remounting the whole list. Selection is untouched.
+                for item, conv, old_key, new_key in zip(
+                    conv_list.children,
+                    self.filtered_conversations,
+                    self._rendered_keys,
+                    new_keys,
+                ):
+                    if old_key != new_key and isinstance(item, ConversationItem):
+                        item.update_conversation(conv)
+
+                # If the open conversation's data changed, the message pane
+                # is stale too — re-show it, not just its sidebar label.
+                index = conv_list.index
+                if (
+                    index is not None
+                    and index < len(new_keys)
+                    and new_keys[index] != self._rendered_keys[index]
+                ):
+                    self._current_conv = None
+                    self._show_conversation(self.filtered_conversations[index])
+            else:
+                # Inserts, removals or reorders: rebuild, but keep the
+                # highlighted conversation selected when it still exists.
+                highlighted: Optional[str] = None
+                if conv_list.index is not None and conv_list.index < len(old_ids):
+                    highlighted = old_ids[conv_list.index]
+
+                conv_list.clear()
+                for conv in self.filtered_conversations:
+                    conv_list.append(ConversationItem(conv))
+
+                if new_ids:
+                    index = (
+                        new_ids.index(highlighted) if highlighted in new_ids else 0
+                    )
+                    conv_list.index = index
+                    self._show_conversation(self.filtered_conversations[index])
+
+            self._rendered_keys = new_keys
 
         # Update status
         total = len(self.all_conversations)
@@ -307,19 +434,19 @@ class TeamsViewer(App[None]):
 
         self.query_one("#status-bar", Label).update(status_text)
 
-        # Select first item if available
-        if self.filtered_conversations and conv_list.children:
-            conv_list.index = 0
-            self._show_conversation(self.filtered_conversations[0])
-
     def _show_conversation(self, conv: Conversation) -> None:
         """Display a conversation's messages."""
+        if conv is self._current_conv:
+            return
+        self._current_conv = conv
+
         # Update header
         header = self.query_one("#conv-header", Label)
         header.update(f"{conv.title} ({len(conv.messages)} messages)")
 
-        # Update messages
-        msg_container = self.query_one("#messages", VerticalScroll)
+        # Update messages: mount only the most recent window; the rest stay
+        # in the store and hydrate when the user scrolls up near the top.
+        msg_container = self.query_one("#messages", MessageScroll)
         msg_container.remove_children()
 
         if not conv.messages:
@@ -330,15 +457,70 @@ class TeamsViewer(App[None]):
                 )
             )
         else:
-            for msg in conv.messages:
-                msg_container.mount(MessageItem(msg))
+            window = self._message_store.load(conv.messages)
+            if self._message_store.hidden_above:
+                msg_container.mount(
+                    Label(
+                        self._hidden_above_text(),
+                        classes="info",
+                        id="hydrate-note",
+                    )
+                )
+            # One mount call for the batch instead of one layout pass each
+            msg_container.mount(*(MessageItem(msg) for msg in window))
 
         msg_container.scroll_end(animate=False)
 
+    def _hidden_above_text(self) -> str:
+        return f"({self._message_store.hidden_above} earlier messages — scroll up to load)"
+
+    def _hydrate_above(self) -> None:
+        """Mount the next batch of older messages above the current window."""
+        if self._hydrating:
+            return
+        batch = self._message_store.hydrate_above()
+        if not batch:
+            return
+
+        self._hydrating = True
+        try:
+            msg_container = self.query_one("#messages", MessageScroll)
+            anchor = next(
+                (w for w in msg_container.children if isinstance(w, MessageItem)),
+                None,
+            )
+            msg_container.mount(
+                *(MessageItem(msg) for msg in batch),
+                before=anchor,
+            )
+
+            note = msg_container.query("#hydrate-note")
+            if note:
+                if self._message_store.hidden_above:
+                    note.first(Label).update(self._hidden_above_text())
+                else:
+                    note.first(Label).remove()
+
+            # Content grew above the viewport; shift scroll_y by the
+            # estimated height of the new widgets so the view doesn't jump.
+            msg_container.scroll_y += len(batch) * self.ESTIMATED_MESSAGE_HEIGHT
+        finally:
+            self._hydrating = False
+
     def action_refresh(self) -> None:
         """Refresh data from the database."""
         self.notify("Refreshing data...")
+        self._refresh_worker()
+
+    @work(thread=True, exclusive=True)
+    def _refresh_worker(self) -> None:
+        """Run discovery and extraction off the main thread.
 
+        The LevelDB parse can take hundreds of ms on large mailboxes;
+        doing it here keeps keyboard, scroll and highlight events live.
+        Widget updates are marshalled back via call_from_thread, and
+        exclusive=True coalesces rapid refresh keypresses.
+        """
         try:
             # Get database path
             if self._specified_db_path:
@@ -348,23 +530,55 @@ class TeamsViewer(App[None]):
                 self.db_location = discovery.find_first()
                 db_path = self.db_location.path
 
+            # LevelDB bumps a file mtime on any write (log append or
+            # compaction), so an unchanged max-mtime means an unchanged db
+            # and the whole copy-and-parse can be skipped.
+            mtime = max(
+                (p.stat().st_mtime for p in db_path.glob("*") if p.is_file()),
+                default=0.0,
+            )
+            if (
+                self._conv_cache is not None
+                and mtime > 0.0
+                and self._conv_cache[0] == mtime
+            ):
+                self.call_from_thread(
+                    self._apply_refresh,
+                    self._conv_cache[1],
+                    "Database unchanged; reusing loaded conversations",
+                )
+                return
+
             # Extract data
             with TeamsDatabaseExtractor(db_path) as extractor:
-                self.all_conversations = extractor.get_conversations()
-
-            self._apply_filter()
+                conversations = extractor.get_conversations()
 
+            self._conv_cache = (mtime, conversations)
             source = self.db_location.source if self.db_location else "specified"
-            self.notify(
-                f"Loaded {len(self.all_conversations)} conversations from {source}"
+            self.call_from_thread(
+                self._apply_refresh,
+                conversations,
+                f"Loaded {len(conversations)} conversations from {source}",
             )
 
         except DatabaseNotFoundError as e:
-            self.notify(f"Database not found: {e}", severity="error")
+            self.call_from_thread(
+                self.notify, f"Database not found: {e}", severity="error"
+            )
         except ExtractionError as e:
-            self.notify(f"Error reading database: {e}", severity="error")
+            self.call_from_thread(
+                self.notify, f"Error reading database: {e}", severity="error"
+            )
         except Exception as e:
-            self.notify(f"Unexpected error: {e}", severity="error")
+            self.call_from_thread(
+                self.notify, f"Unexpected error: {e}", severity="error"
+            )
+
+    def _apply_refresh(self, conversations: List[Conversation], note: str) -> None:
+        """Apply extraction results on the main thread."""
+        self.all_conversations = conversations
+        self._apply_filter()
+        self.notify(note)
 
     def action_focus_search(self) -> None:
         """Focus the search input."""
@@ -408,9 +622,19 @@ class TeamsViewer(App[None]):
         self.notify("Showing all conversations")
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Handle search input changes, debounced to coalesce fast typing."""
         if event.input.id == "search-box":
-            self.current_filter = event.value
+            self._pending_filter = event.value
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(
+                self.SEARCH_DEBOUNCE, self._commit_search
+            )
+
+    def _commit_search(self) -> None:
+        """Apply the most recent search text after the debounce delay."""
+        self._search_timer = None
+        self.current_filter = self._pending_filter
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Handle conversation selection."""
@@ -1,8 +1,10 @@
 import os
 import asyncio
+import json
+import time
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+from typing import AsyncIterator, List, Dict, Optional, Any
 from datetime import datetime
 from telethon import TelegramClient, events, utils
 from telethon.tl.types import Channel, Chat, User, Message as TelethonMessage
@@ -12,14 +14,14 @@ load_dotenv()
 
 # --- Data Models ---
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     id: str
     display_name: str
     username: Optional[str]
     phone: Optional[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     id: str
     sender_id: str
@@ -29,7 +31,7 @@ class Message:
     conversation_id: str
     is_unread: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Conversation:
     id: str
     title: str
@@ -38,8 +40,22 @@ class Conversation:
     unread_count: int = 0
     thread_type: str = "Chat" # Chat, Group, Channel
 
+def _sender_id(msg: TelethonMessage) -> int:
+    """Resolve a message's sender id with one attribute probe.
+
+    from_id is unset for messages in user dialogs, where peer_id carries
+    the user; channel/chat peers have no user_id, hence the 0 default.
+    """
+    peer = msg.from_id or msg.peer_id
+    return getattr(peer, 'user_id', 0)
+
+
 # --- Extractor Class ---
 
+# How long cached sender profiles stay valid on disk (1 day); display
+# names change rarely, and each miss costs a get_entity round trip.
+PROFILE_CACHE_TTL = 86400
+
 class TelegramExtractor:
     def __init__(self, api_id: int, api_hash: str, session_name: str = "clearway_telegram"):
         self.api_id = api_id
@@ -48,73 +64,163 @@ class TelegramExtractor:
         self.session_path.parent.mkdir(exist_ok=True)
         self.client = TelegramClient(str(self.session_path), api_id, api_hash)
         self.profiles: Dict[int, UserProfile] = {}
+        self._profile_cache_path = self.session_path.with_suffix(".profiles.json")
+        self._profile_cached_at: Dict[int, float] = {}
+        # get_messages tails may run as concurrent tasks (see main), so
+        # profile cache writes need a lock
+        self._profiles_lock = asyncio.Lock()
+        # Per-conversation state kept from the metadata pass so messages
+        # can be fetched lazily later without re-resolving the dialog
+        self._entities: Dict[str, Any] = {}
+        self._read_max_ids: Dict[str, int] = {}
+        self._messages_cache: Dict[str, List[Message]] = {}
 
     async def __aenter__(self):
         await self.client.start()
+        self._load_profile_cache()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._save_profile_cache()
         await self.client.disconnect()
 
-    async def _get_sender_name(self, sender_id: int) -> str:
-        if sender_id in self.profiles:
-            return self.profiles[sender_id].display_name
-        
+    def _load_profile_cache(self):
+        """Seed self.profiles from disk so warm runs skip get_entity calls."""
         try:
-            entity = await self.client.get_entity(sender_id)
-            name = utils.get_display_name(entity)
+            raw = json.loads(self._profile_cache_path.read_text())
+        except (OSError, ValueError):
+            return
+
+        cutoff = time.time() - PROFILE_CACHE_TTL
+        for key, entry in raw.items():
+            try:
+                sender_id = int(key)
+                cached_at = float(entry["cached_at"])
+            except (TypeError, ValueError, KeyError):
+                continue
+            if cached_at < cutoff:
+                continue
             self.profiles[sender_id] = UserProfile(
                 id=str(sender_id),
-                display_name=name,
-                username=getattr(entity, 'username', None),
-                phone=getattr(entity, 'phone', None)
+                display_name=entry.get("display_name", "Unknown"),
+                username=entry.get("username"),
+                phone=entry.get("phone"),
             )
+            self._profile_cached_at[sender_id] = cached_at
+
+    def _save_profile_cache(self):
+        """Persist resolved profiles next to the session file.
+
+        Entries keep their original cached_at so stale profiles age out
+        and get re-resolved instead of living forever.
+        """
+        now = time.time()
+        payload = {
+            str(sender_id): {
+                "display_name": profile.display_name,
+                "username": profile.username,
+                "phone": profile.phone,
+                "cached_at": self._profile_cached_at.get(sender_id, now),
+            }
+            for sender_id, profile in self.profiles.items()
+        }
+        try:
+            self._profile_cache_path.write_text(json.dumps(payload))
+        except OSError:
+            pass  # cache is best-effort
+
+    async def _get_sender_name(self, sender_id: int) -> str:
+        profile = self.profiles.get(sender_id)
+        if profile is not None:
+            return profile.display_name
+
+        try:
+            entity = await self.client.get_entity(sender_id)
+            name = utils.get_display_name(entity)
+            async with self._profiles_lock:
+                self.profiles[sender_id] = UserProfile(
+                    id=str(sender_id),
+                    display_name=name,
+                    username=getattr(entity, 'username', None),
+                    phone=getattr(entity, 'phone', None)
+                )
+                self._profile_cached_at[sender_id] = time.time()
             return name
         except Exception:
             return "Unknown"
 
-    async def get_conversations(self, limit: int = 20) -> List[Conversation]:
-        conversations = []
+    async def iter_conversations(self, limit: int = 20) -> AsyncIterator[Conversation]:
+        """Yield conversation metadata as each dialog arrives.
+
+        iter_dialogs already returns dialogs newest-first, so streaming
+        consumers see the right order without waiting for the full list;
+        messages load lazily via get_messages. The first conversation is
+        available after ~1 round trip instead of after all of them.
+        """
         async for dialog in self.client.iter_dialogs(limit=limit):
             entity = dialog.entity
             cid = str(dialog.id)
-            title = dialog.name
-            
+
             thread_type = "Chat"
             if isinstance(entity, Channel):
                 thread_type = "Channel" if entity.broadcast else "Group"
             elif isinstance(entity, Chat):
                 thread_type = "Group"
 
-            messages = []
-            async for msg in self.client.iter_messages(entity, limit=5):
-                if not isinstance(msg, TelethonMessage):
-                    continue
-                
-                sender_id = msg.from_id.user_id if hasattr(msg.from_id, 'user_id') else (msg.peer_id.user_id if hasattr(msg.peer_id, 'user_id') else 0)
-                sender_name = await self._get_sender_name(sender_id)
-                
-                messages.append(Message(
-                    id=str(msg.id),
-                    sender_id=str(sender_id),
-                    sender_name=sender_name,
-                    content=msg.text or "[Media/Non-text]",
-                    timestamp=msg.date,
-                    conversation_id=cid,
-                    is_unread=msg.id > dialog.read_inbox_max_id if hasattr(dialog, 'read_inbox_max_id') else False
-                ))
-
-            conversations.append(Conversation(
+            self._entities[cid] = entity
+            self._read_max_ids[cid] = getattr(dialog, 'read_inbox_max_id', 0)
+
+            yield Conversation(
                 id=cid,
-                title=title,
+                title=dialog.name,
                 last_message_time=dialog.date,
-                messages=messages,
+                messages=[],
                 unread_count=dialog.unread_count,
                 thread_type=thread_type
-            ))
+            )
 
+    async def get_conversations(self, limit: int = 20) -> List[Conversation]:
+        """Collect iter_conversations into a list, newest first."""
+        conversations = [c async for c in self.iter_conversations(limit=limit)]
         return sorted(conversations, key=lambda x: x.last_message_time, reverse=True)
 
+    async def get_messages(self, conv_id: str, limit: int = 5) -> List[Message]:
+        """Fetch and cache the most recent messages for one conversation.
+
+        One GetHistoryRequest per conversation, issued only when a caller
+        actually wants the messages; callers wanting several conversations
+        at once should gather these so the requests pipeline.
+        """
+        cached = self._messages_cache.get(conv_id)
+        if cached is not None:
+            return cached
+
+        entity = self._entities.get(conv_id)
+        if entity is None:
+            return []
+
+        read_max_id = self._read_max_ids.get(conv_id, 0)
+        messages = []
+        for msg in await self.client.get_messages(entity, limit=limit):
+            if not isinstance(msg, TelethonMessage):
+                continue
+
+            sender_id = _sender_id(msg)
+            sender_name = await self._get_sender_name(sender_id)
+
+            messages.append(Message(
+                id=str(msg.id),
+                sender_id=str(sender_id),
+                sender_name=sender_name,
+                content=msg.text or "[Media/Non-text]",
+                timestamp=msg.date,
+                conversation_id=conv_id,
+                is_unread=msg.id > read_max_id
+            ))
+
+        self._messages_cache[conv_id] = messages
+        return messages
+
 # --- Execution ---
 
 async def main():
@@ -128,28 +234,35 @@ async def main():
     print(f"Initializing Telegram Message Bridge...")
     try:
         async with TelegramExtractor(int(api_id), api_hash) as extractor:
-            conversations = await extractor.get_conversations()
-            
-            print(f"\nFound {len(conversations)} conversations.\n")
+            # Kick off each conversation's tail fetch as a task the moment
+            # its dialog arrives (newest-first already), so the history
+            # requests pipeline behind the dialog stream instead of running
+            # one round trip at a time.
+            tails = []
+            async for conv in extractor.iter_conversations():
+                tails.append((conv, asyncio.create_task(extractor.get_messages(conv.id))))
+
             print("=" * 60)
-            
-            for conv in conversations:
+
+            for conv, tail in tails:
                 if conv.unread_count > 0:
                     print(f"CONVERSATION: {conv.title} ({conv.unread_count} UNREAD)")
                 else:
                     print(f"CONVERSATION: {conv.title}")
-                    
+
                 print(f"ID: {conv.id}")
                 print(f"Type: {conv.thread_type}")
                 print(f"Last Active: {conv.last_message_time}")
                 print("-" * 30)
-                
+
                 # Show last 3 messages
-                for msg in conv.messages[:3]:
-                    print(f"[{msg.timestamp.strftime('%Y-%m-%d %H:%M')}] {msg.sender_name}: {msg.content[:100]}...")
-                
+                for msg in (await tail)[:3]:
+                    print(f"[{msg.timestamp:%Y-%m-%d %H:%M}] {msg.sender_name}: {msg.content[:100]}...")
+
                 print("=" * 60)
 
+            print(f"\nFound {len(tails)} conversations.")
+
     except Exception as e:
         print(f"Fatal error: {e}")
         import traceback
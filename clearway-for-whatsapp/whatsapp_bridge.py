@@ -1,9 +1,10 @@
 import os
 import signal
+import threading
 import time
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 from neonize.client import NewClient
 from neonize.events import ConnectedEv, MessageEv, PairStatusEv
@@ -15,13 +16,13 @@ load_dotenv()
 
 # --- Data Models ---
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     id: str
     display_name: str
     push_name: Optional[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     id: str
     sender_id: str
@@ -31,7 +32,7 @@ class Message:
     conversation_id: str
     is_unread: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Conversation:
     id: str
     title: str
@@ -43,40 +44,54 @@ class Conversation:
 # --- Extractor Class ---
 
 class WhatsAppExtractor:
+    # Burst refreshes (rapid keypresses, pollers) within this window reuse
+    # the previous snapshot instead of re-querying the store.
+    CONVERSATIONS_TTL = 5.0
+
     def __init__(self, db_path: str = "whatsapp.db"):
         self.client = NewClient(db_path)
         self.conversations: List[Conversation] = []
         self.is_connected = False
+        self._connected_evt = threading.Event()
+        self._conv_cache: Optional[Tuple[float, List[Conversation]]] = None
 
     def on_connected(self, client: NewClient, event: ConnectedEv):
         log.info("Connected to WhatsApp")
         self.is_connected = True
+        self._connected_evt.set()
 
     def __enter__(self):
         self.client.event_handler.register(ConnectedEv, self.on_connected)
         self.client.connect()
-        # Wait for connection (simple sync wait for CLI demo)
-        timeout = 30
-        start = time.time()
-        while not self.is_connected and time.time() - start < timeout:
-            time.sleep(1)
+        # Block until the connect callback fires (or give up after 30s);
+        # the old 1s polling loop added up to a second of dead time.
+        self._connected_evt.wait(timeout=30)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.client.disconnect()
 
     def get_conversations(self) -> List[Conversation]:
-        # Note: Neonize/Whatsmeow typically works via event streams. 
-        # For a "snapshot" bridge, we'd query the local store if available, 
+        # Note: Neonize/Whatsmeow typically works via event streams.
+        # For a "snapshot" bridge, we'd query the local store if available,
         # but whatsmeow store is usually internal.
         # This implementation shows how we'd map the data once received/synced.
-        
+
         # In a real bridge, we'd use client.get_contact, client.get_group_info, etc.
         # For now, this is a skeleton showing the interface compatibility.
-        
+
+        now = time.monotonic()
+        if (
+            self._conv_cache is not None
+            and now - self._conv_cache[0] < self.CONVERSATIONS_TTL
+        ):
+            return self._conv_cache[1]
+
         log.info("Fetching conversations...")
         # Placeholder for actual store query logic
-        return self.conversations
+        conversations = self.conversations
+        self._conv_cache = (now, conversations)
+        return conversations
 
 # --- Execution ---
 